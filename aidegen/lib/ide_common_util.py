@@ -29,6 +29,14 @@ from aidegen import constant
 
 _IDEA_FOLDER = '.idea'
 _IML_EXTENSION = '.iml'
+# Seconds to wait for the IDE launching script to fail right away.
+_RUN_IDE_SH_TIMEOUT = 2
+# A dict to cache the sorted launch script paths of IntelliJ versions as:
+# {version_path: [sh_path1, sh_path2, ...]}.
+_INTELLIJ_VERSION_PATH_CACHE = dict()
+# A dict to cache the glob results of IDE config folders as:
+# {pattern: [path1, path2, ...]}.
+_GLOB_CACHE = dict()
 
 
 def get_script_from_internal_path(ide_paths, ide_name):
@@ -56,17 +64,33 @@ def get_script_from_internal_path(ide_paths, ide_name):
 def _run_ide_sh(run_sh_cmd, project_path):
     """Run IDE launching script with an IntelliJ project path as argument.
 
+    The arguments are validated by launch_ide before getting here. The IDE
+    is started in a new session without inheriting AIDEGen's standard
+    streams, so AIDEGen only waits _RUN_IDE_SH_TIMEOUT seconds to catch a
+    script failing right away instead of waiting for the IDE to be closed.
+
     Args:
         run_sh_cmd: The command to launch IDE.
         project_path: The path of IntelliJ IDEA project content.
     """
-    assert run_sh_cmd, 'No suitable IDE installed.'
     logging.debug('Run command: "%s" to launch project.', run_sh_cmd)
     try:
-        subprocess.check_call(run_sh_cmd, shell=True)
-    except subprocess.CalledProcessError as err:
+        proc = subprocess.Popen(run_sh_cmd, shell=True,
+                                start_new_session=True,
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, close_fds=True)
+        returncode = proc.wait(timeout=_RUN_IDE_SH_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        # The IDE is still running, it has been launched successfully.
+        return
+    except (OSError, subprocess.SubprocessError) as err:
         logging.error('Launch project path %s failed with error: %s.',
                       project_path, err)
+        return
+    if returncode:
+        logging.error('Launch project path %s failed with exit code: %d.',
+                      project_path, returncode)
 
 
 def _walk_tree_find_ide_exe_file(top, ide_script_name):
@@ -154,6 +178,7 @@ def launch_ide(project_path, run_ide_cmd, ide_name):
         ide_name: the IDE name is to be launched.
     """
     assert project_path, 'Empty content path is not allowed.'
+    assert run_ide_cmd, 'No suitable IDE installed.'
     if ide_name == constant.IDE_ECLIPSE:
         logging.info(
             'Launch %s with workspace: %s.', ide_name, constant.ECLIPSE_WS)
@@ -173,16 +198,14 @@ def is_intellij_project(project_path):
     Returns:
         True if project_path is an IntelliJ project, False otherwise.
     """
-    if not os.path.isfile(project_path):
-        return os.path.isdir(project_path) and os.path.isdir(
-            os.path.join(project_path, _IDEA_FOLDER))
-
-    _, ext = os.path.splitext(os.path.basename(project_path))
-    if ext and _IML_EXTENSION == ext.lower():
+    if (project_path.lower().endswith(_IML_EXTENSION)
+            and os.path.isfile(project_path)):
         path = os.path.dirname(project_path)
         logging.debug('Extracted path is: %s.', path)
         return os.path.isdir(os.path.join(path, _IDEA_FOLDER))
-    return False
+    # The .idea folder can only exist when project_path is a directory, so a
+    # single stat answers both questions.
+    return os.path.isdir(os.path.join(project_path, _IDEA_FOLDER))
 
 
 def get_script_from_input_path(input_path, ide_file_name):
@@ -205,7 +228,7 @@ def get_script_from_input_path(input_path, ide_file_name):
     ide_path = []
     if os.path.isfile(input_path):
         ide_path = _get_scripts_from_file_path(input_path, ide_file_name)
-    if os.path.isdir(input_path):
+    elif os.path.isdir(input_path):
         ide_path = get_scripts_from_dir_path(input_path, ide_file_name)
     if ide_path:
         logging.debug('IDE installed path from user input: %s.', ide_path)
@@ -216,6 +239,10 @@ def get_script_from_input_path(input_path, ide_file_name):
 def get_intellij_version_path(version_path):
     """Locates the IntelliJ IDEA launch script path by version.
 
+    The result is cached per version_path and reused as long as all cached
+    scripts still exist. Only a removed script triggers a new glob, a version
+    installed next to the cached ones isn't found until then.
+
     Args:
         version_path: IntelliJ CE or UE version launch script path.
 
@@ -223,13 +250,38 @@ def get_intellij_version_path(version_path):
         A list of the sh full paths, or None if no such IntelliJ version is
         installed.
     """
+    cached = _INTELLIJ_VERSION_PATH_CACHE.get(version_path)
+    if cached and all(os.path.isfile(path) for path in cached):
+        return cached[:]
     ls_output = glob.glob(version_path, recursive=True)
     if not ls_output:
+        _INTELLIJ_VERSION_PATH_CACHE.pop(version_path, None)
         return None
     ls_output = sorted(ls_output, reverse=True)
     logging.debug('Result for checking IntelliJ path %s after sorting:%s.',
                   version_path, ls_output)
-    return ls_output
+    _INTELLIJ_VERSION_PATH_CACHE[version_path] = ls_output
+    return ls_output[:]
+
+
+def cached_glob(pattern):
+    """Get the paths matching a glob pattern, globbing once per pattern.
+
+    Args:
+        pattern: A string of the glob pattern.
+
+    Returns:
+        A list of the matched paths.
+    """
+    if pattern not in _GLOB_CACHE:
+        _GLOB_CACHE[pattern] = glob.glob(pattern)
+    return _GLOB_CACHE[pattern][:]
+
+
+def _reset_ide_cache():
+    """Clear the cached IDE launch script and config folder paths."""
+    _INTELLIJ_VERSION_PATH_CACHE.clear()
+    _GLOB_CACHE.clear()
 
 
 def ask_preference(all_versions, ide_name):
@@ -18,6 +18,7 @@
 """Unittests for ide_common_util."""
 
 import os
+import subprocess
 import unittest
 
 from unittest import mock
@@ -49,6 +50,9 @@ class IdeUtilCommonUnittests(unittest.TestCase):
         IdeUtilCommonUnittests._TEST_PRJ_PATH3 = test_path
         IdeUtilCommonUnittests._TEST_PRJ_PATH4 = os.path.join(
             unittest_constants.TEST_DATA_PATH, '.idea')
+        # Don't share the IDE path cache with the other tests.
+        ide_common_util._reset_ide_cache()
+        self.addCleanup(ide_common_util._reset_ide_cache)
 
     def tearDown(self):
         """Clear the testdata related path."""
@@ -87,6 +91,35 @@ class IdeUtilCommonUnittests(unittest.TestCase):
             ide_common_util.get_intellij_version_path(
                 ide_util.IdeLinuxIntelliJ()._ls_ue_path))
 
+    @mock.patch('os.path.isfile')
+    @mock.patch('glob.glob')
+    def test_get_intellij_version_path_cache(self, mock_glob, mock_isfile):
+        """Test get_intellij_version_path reuses the cached script paths."""
+        mock_glob.return_value = unittest_constants.IDEA_SH_FIND
+        mock_isfile.return_value = True
+        expected = sorted(unittest_constants.IDEA_SH_FIND, reverse=True)
+        self.assertEqual(
+            ide_common_util.get_intellij_version_path('a'), expected)
+        self.assertEqual(
+            ide_common_util.get_intellij_version_path('a'), expected)
+        self.assertEqual(mock_glob.call_count, 1)
+        # The cache is invalidated once a cached script no longer exists.
+        mock_isfile.return_value = False
+        ide_common_util.get_intellij_version_path('a')
+        self.assertEqual(mock_glob.call_count, 2)
+
+    @mock.patch('glob.glob')
+    def test_cached_glob(self, mock_glob):
+        """Test cached_glob globs only once for the same pattern."""
+        mock_glob.return_value = ['a/b', 'a/c']
+        self.assertEqual(ide_common_util.cached_glob('a/*'), ['a/b', 'a/c'])
+        result = ide_common_util.cached_glob('a/*')
+        self.assertEqual(result, ['a/b', 'a/c'])
+        self.assertEqual(mock_glob.call_count, 1)
+        # The caller's list can be changed without affecting the cache.
+        result.append('a/d')
+        self.assertEqual(ide_common_util.cached_glob('a/*'), ['a/b', 'a/c'])
+
     @mock.patch('builtins.input')
     @mock.patch('glob.glob', return_value=unittest_constants.IDEA_SH_FIND)
     def test_ask_preference(self, mock_glob, mock_input):
@@ -103,6 +136,30 @@ class IdeUtilCommonUnittests(unittest.TestCase):
                                            constant.IDE_INTELLIJ),
             unittest_constants.IDEA_SH_FIND[1])
 
+    @mock.patch('logging.error')
+    @mock.patch('subprocess.Popen')
+    def test_run_ide_sh(self, mock_popen, mock_log):
+        """Test _run_ide_sh only reports an IDE script failing right away."""
+        mock_wait = mock_popen.return_value.wait
+        mock_wait.side_effect = subprocess.TimeoutExpired('a/b/idea.sh', 2)
+        ide_common_util._run_ide_sh('a/b/idea.sh', 'xyz/.idea')
+        self.assertTrue(mock_popen.called)
+        self.assertTrue(mock_popen.call_args[1]['start_new_session'])
+        mock_wait.assert_called_with(
+            timeout=ide_common_util._RUN_IDE_SH_TIMEOUT)
+        self.assertFalse(mock_log.called)
+        mock_wait.side_effect = None
+        mock_wait.return_value = 0
+        ide_common_util._run_ide_sh('a/b/idea.sh', 'xyz/.idea')
+        self.assertFalse(mock_log.called)
+        mock_wait.return_value = 1
+        ide_common_util._run_ide_sh('a/b/idea.sh', 'xyz/.idea')
+        self.assertTrue(mock_log.called)
+        mock_log.reset_mock()
+        mock_popen.side_effect = OSError()
+        ide_common_util._run_ide_sh('a/b/idea.sh', 'xyz/.idea')
+        self.assertTrue(mock_log.called)
+
     def test_get_run_ide_cmd(self):
         """Test get_run_ide_cmd."""
         test_script_path = 'a/b/c/d.sh'
@@ -138,6 +195,30 @@ class IdeUtilCommonUnittests(unittest.TestCase):
         self.assertEqual(ide_common_util.get_scripts_from_dir_path(
             test_path, 'd.e'), None)
 
+    @mock.patch.object(ide_common_util, 'get_scripts_from_dir_path')
+    @mock.patch.object(ide_common_util, '_get_scripts_from_file_path')
+    @mock.patch('os.path.isdir')
+    @mock.patch('os.path.isfile')
+    def test_get_script_from_input_path(self, mock_isfile, mock_isdir,
+                                        mock_file_path, mock_dir_path):
+        """Test get_script_from_input_path."""
+        self.assertIsNone(
+            ide_common_util.get_script_from_input_path(None, 'idea.sh'))
+        mock_isfile.return_value = True
+        mock_file_path.return_value = ['a/b/idea.sh']
+        self.assertEqual(
+            ide_common_util.get_script_from_input_path('a/b/idea.sh',
+                                                       'idea.sh'),
+            ['a/b/idea.sh'])
+        self.assertFalse(mock_isdir.called)
+        self.assertFalse(mock_dir_path.called)
+        mock_isfile.return_value = False
+        mock_isdir.return_value = True
+        mock_dir_path.return_value = None
+        self.assertIsNone(
+            ide_common_util.get_script_from_input_path('a/b', 'idea.sh'))
+        self.assertTrue(mock_dir_path.called)
+
 
 if __name__ == '__main__':
     unittest.main()
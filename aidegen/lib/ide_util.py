@@ -30,11 +30,13 @@ existence, IDE type, etc.), launch the project in related IDE.
         ide_util_obj.get_ide_config_folders()
 """
 
+import fnmatch
 import glob
 import logging
 import os
 import platform
 import re
+import shutil
 import subprocess
 
 from xml.etree import ElementTree
@@ -93,6 +95,12 @@ TEST_MAPPING_NAME = 'TEST_MAPPING'
 _TEST_MAPPING_TYPE = '<mapping pattern="TEST_MAPPING" type="JSON" />'
 _XPATH_EXTENSION_MAP = 'component/extensionMap'
 _XPATH_MAPPING = _XPATH_EXTENSION_MAP + '/mapping'
+# Matches the edition and version of an IntelliJ installed folder name, e.g.
+# 'ce' and '2019.3' in /opt/intellij-ce-2019.3/bin/idea.sh.
+_INTELLIJ_VERSION_RE = re.compile(
+    r'intellij-(?P<edition>[^-%s]*)-(?P<version>[^-%s]*)' % (
+        re.escape(os.sep), re.escape(os.sep)))
+_INTELLIJ_CONFIG_PREFIX = {'ce': '.IdeaIC', 'ue': '.IntelliJIdea'}
 
 
 # pylint: disable=too-many-lines
@@ -340,10 +348,17 @@ class IdeBase:
     def _get_ide_from_environment_paths(self):
         """Get IDE executable binary file from environment paths.
 
+        Look up the exact executable name in $PATH first, the same way the
+        shell resolves it, and only walk the environment paths when it isn't
+        found.
+
         Returns:
-            A string of IDE executable binary path if found, otherwise return
+            A list of IDE executable binary paths if found, otherwise return
             None.
         """
+        exe_path = shutil.which(self._bin_file_name)
+        if exe_path:
+            return [exe_path]
         env_paths = os.environ['PATH'].split(':')
         for env_path in env_paths:
             path = ide_common_util.get_scripts_from_dir_path(
@@ -490,8 +505,7 @@ class IdeIntelliJ(IdeBase):
         Returns:
             The sh full path, or None if no IntelliJ version is installed.
         """
-        ce_paths = ide_common_util.get_intellij_version_path(self._ls_ce_path)
-        ue_paths = ide_common_util.get_intellij_version_path(self._ls_ue_path)
+        ce_paths, ue_paths = self._get_ce_ue_versions()
         all_versions = self._get_all_versions(ce_paths, ue_paths)
         tmp_versions = all_versions.copy()
         for version in tmp_versions:
@@ -500,6 +514,16 @@ class IdeIntelliJ(IdeBase):
                 all_versions.remove(version)
         return self._get_user_preference(all_versions)
 
+    def _get_ce_ue_versions(self):
+        """Get the launch script paths of the IntelliJ CE and UE versions.
+
+        Returns:
+            A tuple of the CE and UE launch script path lists, each sorted from
+            the newest version, or None if no such version is installed.
+        """
+        return (ide_common_util.get_intellij_version_path(self._ls_ce_path),
+                ide_common_util.get_intellij_version_path(self._ls_ue_path))
+
     def _setup_ide(self):
         """The callback used to run the necessary setup work for the IDE.
 
@@ -582,24 +606,13 @@ class IdeIntelliJ(IdeBase):
         """
         if not run_script_path or not os.path.isfile(run_script_path):
             return None
-        index = str.find(run_script_path, 'intellij-')
-        target_path = None if index == -1 else run_script_path[index:]
-        if not target_path or '-' not in run_script_path:
+        match = _INTELLIJ_VERSION_RE.search(run_script_path)
+        if not match:
             return None
-
-        path_data = target_path.split('-')
-        if not path_data or len(path_data) < 3:
+        prefix = _INTELLIJ_CONFIG_PREFIX.get(match.group('edition'))
+        if not prefix:
             return None
-
-        config_folder = None
-        ide_version = path_data[2].split(os.sep)[0]
-
-        if path_data[1] == 'ce':
-            config_folder = ''.join(['.IdeaIC', ide_version])
-        elif path_data[1] == 'ue':
-            config_folder = ''.join(['.IntelliJIdea', ide_version])
-
-        return config_folder
+        return ''.join([prefix, match.group('version')])
 
 
 class IdeLinuxIntelliJ(IdeIntelliJ):
@@ -637,6 +650,22 @@ class IdeLinuxIntelliJ(IdeIntelliJ):
                                         self._bin_file_name)
         self._init_installed_path(installed_path)
 
+    def _get_ce_ue_versions(self):
+        """Get the launch script paths of the IntelliJ CE and UE versions.
+
+        Both versions are installed under /opt, so glob all of them once and
+        split the result by version instead of globbing /opt per version.
+
+        Returns:
+            A tuple of the CE and UE launch script path lists, each sorted from
+            the newest version, or None if no such version is installed.
+        """
+        all_paths = ide_common_util.get_intellij_version_path(
+            os.path.join(self._bin_folders[0], self._bin_file_name)) or []
+        ce_paths = fnmatch.filter(all_paths, self._ls_ce_path)
+        ue_paths = fnmatch.filter(all_paths, self._ls_ue_path)
+        return ce_paths or None, ue_paths or None
+
     def _get_config_root_paths(self):
         """To collect the global config folder paths of IDEA as a string list.
 
@@ -670,10 +699,10 @@ class IdeLinuxIntelliJ(IdeIntelliJ):
         else:
             # TODO(b/123459239): For the case that the user provides the IDEA
             # binary path, we now collect all possible IDEA config root paths.
-            _config_folders = glob.glob(
+            _config_folders = ide_common_util.cached_glob(
                 os.path.join(os.getenv('HOME'), '.IdeaI?20*'))
-            _config_folders.extend(
-                glob.glob(os.path.join(os.getenv('HOME'), '.IntelliJIdea20*')))
+            _config_folders.extend(ide_common_util.cached_glob(
+                os.path.join(os.getenv('HOME'), '.IntelliJIdea20*')))
             logging.debug('The config path list: %s.', _config_folders)
 
         return _config_folders
@@ -719,11 +748,11 @@ class IdeMacIntelliJ(IdeIntelliJ):
 
         _config_folders = []
         if 'IntelliJ' in self._installed_path:
-            _config_folders = glob.glob(
+            _config_folders = ide_common_util.cached_glob(
                 os.path.join(
                     os.getenv('HOME'), 'Library/Preferences/IdeaI?20*'))
             _config_folders.extend(
-                glob.glob(
+                ide_common_util.cached_glob(
                     os.path.join(
                         os.getenv('HOME'),
                         'Library/Preferences/IntelliJIdea20*')))
@@ -835,7 +864,8 @@ class IdeLinuxStudio(IdeStudio):
             A string list for IDE config root paths, and return an empty list
             when none is found.
         """
-        return glob.glob(os.path.join(os.getenv('HOME'), '.AndroidStudio*'))
+        return ide_common_util.cached_glob(
+            os.path.join(os.getenv('HOME'), '.AndroidStudio*'))
 
 
 class IdeMacStudio(IdeStudio):
@@ -866,7 +896,7 @@ class IdeMacStudio(IdeStudio):
             A string list for IDE config root paths, and return an empty list
             when none is found.
         """
-        return glob.glob(
+        return ide_common_util.cached_glob(
             os.path.join(
                 os.getenv('HOME'), 'Library/Preferences/AndroidStudio*'))
 
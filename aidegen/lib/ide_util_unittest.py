@@ -46,12 +46,16 @@ from aidegen.sdk import jdk_table
 class IdeUtilUnittests(unittest.TestCase):
     """Unit tests for ide_util.py."""
 
-    _TEST_PRJ_PATH1 = ''
-    _TEST_PRJ_PATH2 = ''
-    _TEST_PRJ_PATH3 = ''
-    _TEST_PRJ_PATH4 = ''
-    _MODULE_XML_SAMPLE = ''
+    _TEST_PRJ_PATH1 = os.path.join(unittest_constants.TEST_DATA_PATH,
+                                   'android_facet.iml')
+    _TEST_PRJ_PATH2 = os.path.join(unittest_constants.TEST_DATA_PATH,
+                                   'project/test.java')
+    _TEST_PRJ_PATH3 = unittest_constants.TEST_DATA_PATH
+    _TEST_PRJ_PATH4 = os.path.join(unittest_constants.TEST_DATA_PATH, '.idea')
+    _MODULE_XML_SAMPLE = os.path.join(unittest_constants.TEST_DATA_PATH,
+                                      'modules.xml')
     _TEST_DIR = None
+    _IS_MAC = False
     _TEST_XML_CONTENT = """<application>
   <component name="FileTypeManager" version="17">
     <extensionMap>
@@ -69,26 +73,25 @@ class IdeUtilUnittests(unittest.TestCase):
   </component>
 </application>"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Detect the OS type once for the OS dependent tests."""
+        cls._IS_MAC = (android_dev_os.AndroidDevOS.MAC ==
+                       android_dev_os.AndroidDevOS.get_os_type())
+
     def setUp(self):
-        """Prepare the testdata related path."""
-        IdeUtilUnittests._TEST_PRJ_PATH1 = os.path.join(
-            unittest_constants.TEST_DATA_PATH, 'android_facet.iml')
-        IdeUtilUnittests._TEST_PRJ_PATH2 = os.path.join(
-            unittest_constants.TEST_DATA_PATH, 'project/test.java')
-        IdeUtilUnittests._TEST_PRJ_PATH3 = unittest_constants.TEST_DATA_PATH
-        IdeUtilUnittests._TEST_PRJ_PATH4 = os.path.join(
-            unittest_constants.TEST_DATA_PATH, '.idea')
-        IdeUtilUnittests._MODULE_XML_SAMPLE = os.path.join(
-            unittest_constants.TEST_DATA_PATH, 'modules.xml')
-        IdeUtilUnittests._TEST_DIR = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clear the testdata related path."""
-        IdeUtilUnittests._TEST_PRJ_PATH1 = ''
-        IdeUtilUnittests._TEST_PRJ_PATH2 = ''
-        IdeUtilUnittests._TEST_PRJ_PATH3 = ''
-        IdeUtilUnittests._TEST_PRJ_PATH4 = ''
-        shutil.rmtree(IdeUtilUnittests._TEST_DIR)
+        """Prepare the temporary test folder and the common mocks."""
+        test_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(test_dir.cleanup)
+        IdeUtilUnittests._TEST_DIR = test_dir.name
+        # Don't share the IDE path cache with the other tests.
+        ide_common_util._reset_ide_cache()
+        self.addCleanup(ide_common_util._reset_ide_cache)
+        # Never write the user's real AIDEGen config file in the tests.
+        patcher = mock.patch.object(config.AidegenConfig,
+                                    'set_preferred_version')
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @unittest.skip('Skip to use real command to launch IDEA.')
     def test_run_intellij_sh_in_linux(self):
@@ -111,15 +114,13 @@ class IdeUtilUnittests(unittest.TestCase):
         self.assertTrue(mock_linux.called)
 
     @mock.patch.object(ide_util.IdeBase, '_get_user_preference')
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch.object(ide_util.IdeEclipse, '_get_script_from_system')
     @mock.patch.object(ide_util.IdeIntelliJ, '_get_preferred_version')
-    def test_get_mac_and_linux_ide(self, mock_preference, mock_path, mock_cfg,
+    def test_get_mac_and_linux_ide(self, mock_preference, mock_path,
                                    mock_version):
         """Test if _get_mac_ide and _get_linux_ide return correct IDE class."""
         mock_preference.return_value = None
         mock_path.return_value = 'path'
-        mock_cfg.return_value = None
         mock_version.return_value = 'default'
         self.assertIsInstance(ide_util._get_mac_ide(), ide_util.IdeMacIntelliJ)
         self.assertIsInstance(ide_util._get_mac_ide(None, 's'),
@@ -171,69 +172,56 @@ class IdeUtilUnittests(unittest.TestCase):
         self.assertFalse(mock_paths.called)
 
     @mock.patch.object(ide_util.IdeIntelliJ, '_setup_ide')
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch.object(os.path, 'isfile')
     @mock.patch.object(os.path, 'realpath')
     @mock.patch.object(ide_common_util, 'get_script_from_input_path')
     @mock.patch.object(ide_common_util, 'get_script_from_internal_path')
     def test_get_linux_config_1(self, mock_path, mock_path2, mock_path3,
-                                mock_is_file, mock_cfg, mock_setup_ide):
+                                mock_is_file, mock_setup_ide):
         """Test to get unique config path for linux IDEA case."""
-        if (not android_dev_os.AndroidDevOS.MAC ==
-                android_dev_os.AndroidDevOS.get_os_type()):
+        if not self._IS_MAC:
             mock_path.return_value = ['/opt/intellij-ce-2018.3/bin/idea.sh']
             mock_path2.return_value = ['/opt/intellij-ce-2018.3/bin/idea.sh']
             mock_path3.return_value = '/opt/intellij-ce-2018.3/bin/idea.sh'
             mock_is_file.return_value = True
-            mock_cfg.return_value = None
             mock_setup_ide.return_value = None
             ide_obj = ide_util.IdeLinuxIntelliJ('default_path')
             self.assertEqual(1, len(ide_obj._get_config_root_paths()))
         else:
-            self.assertTrue((android_dev_os.AndroidDevOS.MAC ==
-                             android_dev_os.AndroidDevOS.get_os_type()))
+            self.assertTrue(self._IS_MAC)
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch('glob.glob')
     @mock.patch.object(ide_common_util, 'get_script_from_input_path')
     @mock.patch.object(ide_common_util, 'get_script_from_internal_path')
-    def test_get_linux_config_2(self, mock_path, mock_path_2, mock_filter,
-                                mock_cfg):
+    def test_get_linux_config_2(self, mock_path, mock_path_2, mock_filter):
         """Test to get unique config path for linux IDEA case."""
-        if (not android_dev_os.AndroidDevOS.MAC ==
-                android_dev_os.AndroidDevOS.get_os_type()):
+        if not self._IS_MAC:
             mock_path.return_value = ['/opt/intelliJ-ce-2018.3/bin/idea.sh']
             mock_path_2.return_value = ['/opt/intelliJ-ce-2018.3/bin/idea.sh']
-            mock_cfg.return_value = None
             ide_obj = ide_util.IdeLinuxIntelliJ()
             mock_filter.called = False
             ide_obj._get_config_root_paths()
             self.assertFalse(mock_filter.called)
         else:
-            self.assertTrue((android_dev_os.AndroidDevOS.MAC ==
-                             android_dev_os.AndroidDevOS.get_os_type()))
+            self.assertTrue(self._IS_MAC)
 
     def test_get_mac_config_root_paths(self):
         """Return None if there's no install path."""
-        if (android_dev_os.AndroidDevOS.MAC ==
-                android_dev_os.AndroidDevOS.get_os_type()):
+        if self._IS_MAC:
             mac_ide = ide_util.IdeMacIntelliJ()
             mac_ide._installed_path = None
             self.assertIsNone(mac_ide._get_config_root_paths())
         else:
-            self.assertFalse((android_dev_os.AndroidDevOS.MAC ==
-                              android_dev_os.AndroidDevOS.get_os_type()))
+            self.assertFalse(self._IS_MAC)
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch('glob.glob')
     @mock.patch.object(ide_common_util, 'get_script_from_input_path')
     @mock.patch.object(ide_common_util, 'get_script_from_internal_path')
-    def test_get_linux_config_root(self, mock_path_1, mock_path_2, mock_filter,
-                                   mock_cfg):
+    def test_get_linux_config_root(self, mock_path_1, mock_path_2,
+                                   mock_filter):
         """Test to go filter logic for self download case."""
         mock_path_1.return_value = ['/usr/tester/IDEA/IC2018.3.3/bin']
         mock_path_2.return_value = ['/usr/tester/IDEA/IC2018.3.3/bin']
-        mock_cfg.return_value = None
         ide_obj = ide_util.IdeLinuxIntelliJ()
         mock_filter.reset()
         ide_obj._get_config_root_paths()
@@ -313,11 +301,9 @@ class IdeUtilUnittests(unittest.TestCase):
         self.assertEqual(
             ide_obj._get_real_path(merged_version[0]), symbolic_path)
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch('os.path.isfile')
-    def test_get_application_path(self, mock_isfile, mock_cfg):
+    def test_get_application_path(self, mock_isfile):
         """Test _get_application_path."""
-        mock_cfg.return_value = None
         ide_obj = ide_util.IdeLinuxIntelliJ('default_path')
         mock_isfile.return_value = True
         test_path = None
@@ -348,36 +334,32 @@ class IdeUtilUnittests(unittest.TestCase):
         project_config.ProjectConfig(args)
         self.assertEqual(ide_util.get_ide_util_instance(args), None)
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch.object(ide_util.IdeIntelliJ, '_get_preferred_version')
-    def test_get_ide_util_instance_with_success(self, mock_preference,
-                                                mock_cfg_write):
+    def test_get_ide_util_instance_with_success(self, mock_preference):
         """Test _get_ide_util_instance with success."""
         args = aidegen_main._parse_args(['tradefed'])
         project_config.ProjectConfig(args)
-        mock_cfg_write.return_value = None
         mock_preference.return_value = '1'
         self.assertIsInstance(
             ide_util.get_ide_util_instance(), ide_util.IdeUtil)
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch.object(ide_util.IdeIntelliJ, '_get_preferred_version')
     @mock.patch.object(ide_util.IdeUtil, 'is_ide_installed')
-    def test_get_ide_util_instance_with_failure(
-            self, mock_installed, mock_preference, mock_cfg_write):
+    def test_get_ide_util_instance_with_failure(self, mock_installed,
+                                                mock_preference):
         """Test _get_ide_util_instance with failure."""
         args = aidegen_main._parse_args(['tradefed'])
         project_config.ProjectConfig(args)
         mock_installed.return_value = False
-        mock_cfg_write.return_value = None
         mock_preference.return_value = '1'
         with self.assertRaises(errors.IDENotExistError):
             ide_util.get_ide_util_instance()
 
+    @mock.patch('shutil.which')
     @mock.patch.object(ide_common_util, 'get_scripts_from_dir_path')
     @mock.patch.object(ide_common_util, '_run_ide_sh')
     @mock.patch('logging.info')
-    def test_ide_base(self, mock_log, mock_run_ide, mock_run_path):
+    def test_ide_base(self, mock_log, mock_run_ide, mock_run_path, mock_which):
         """Test ide_base class."""
         # Test raise NotImplementedError.
         ide_base = ide_util.IdeBase()
@@ -400,12 +382,20 @@ class IdeUtilUnittests(unittest.TestCase):
         self.assertTrue(mock_log.called)
 
         # Test _get_ide_from_environment_paths.
+        mock_which.return_value = None
         mock_run_path.return_value = '/a/b/idea.sh'
         ide_base._bin_file_name = 'idea.sh'
         expected_path = '/a/b/idea.sh'
         ide_path = ide_base._get_ide_from_environment_paths()
         self.assertEqual(ide_path, expected_path)
 
+        # Test the executable is found in $PATH without walking the paths.
+        mock_run_path.reset_mock()
+        mock_which.return_value = '/c/d/idea.sh'
+        ide_path = ide_base._get_ide_from_environment_paths()
+        self.assertEqual(ide_path, ['/c/d/idea.sh'])
+        self.assertFalse(mock_run_path.called)
+
     def test_ide_intellij(self):
         """Test IdeIntelliJ class."""
         # Test raise NotImplementedError.
@@ -413,7 +403,6 @@ class IdeUtilUnittests(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             ide_intellij._get_config_root_paths()
 
-    @mock.patch.object(config.AidegenConfig, 'set_preferred_version')
     @mock.patch.object(config.AidegenConfig, 'preferred_version')
     @mock.patch.object(ide_common_util, 'ask_preference')
     @mock.patch.object(config.AidegenConfig, 'deprecated_intellij_version')
@@ -422,10 +411,8 @@ class IdeUtilUnittests(unittest.TestCase):
                                             mock_all_versions,
                                             mock_deprecated_version,
                                             mock_ask_preference,
-                                            mock_preference,
-                                            mock_write_cfg):
+                                            mock_preference):
         """Test _get_preferred_version for IdeIntelliJ class."""
-        mock_write_cfg.return_value = None
         ide_intellij = ide_util.IdeIntelliJ()
 
         # No IntelliJ version is installed.
@@ -547,11 +534,11 @@ class IdeUtilUnittests(unittest.TestCase):
     def test_linux_android_studio_class(self, mock_get_home, mock_ask):
         """Test the method _get_config_root_paths of IdeLinuxStudio."""
         mock_get_home.return_value = self._TEST_DIR
-        studio_config_dir1 = os.path.join(self._TEST_DIR, '.AndroidStudio3.0')
-        studio_config_dir2 = os.path.join(self._TEST_DIR, '.AndroidStudio3.1')
-        os.makedirs(studio_config_dir1)
-        os.makedirs(studio_config_dir2)
-        expected_result = [studio_config_dir1, studio_config_dir2]
+        expected_result = []
+        for name in ('.AndroidStudio3.0', '.AndroidStudio3.1'):
+            studio_config_dir = os.path.join(self._TEST_DIR, name)
+            os.mkdir(studio_config_dir)
+            expected_result.append(studio_config_dir)
         mock_ask.return_value = None
         obj = ide_util.IdeLinuxStudio()
         config_paths = obj._get_config_root_paths()
@@ -561,13 +548,13 @@ class IdeUtilUnittests(unittest.TestCase):
     def test_mac_android_studio_class(self, mock_get_home):
         """Test the method _get_config_root_paths of IdeMacStudio."""
         mock_get_home.return_value = self._TEST_DIR
-        studio_config_dir1 = os.path.join(self._TEST_DIR, 'Library',
-                                          'Preferences', 'AndroidStudio3.0')
-        studio_config_dir2 = os.path.join(self._TEST_DIR, 'Library',
-                                          'Preferences', 'AndroidStudio3.1')
-        os.makedirs(studio_config_dir1)
-        os.makedirs(studio_config_dir2)
-        expected_result = [studio_config_dir1, studio_config_dir2]
+        prefs_dir = os.path.join(self._TEST_DIR, 'Library', 'Preferences')
+        os.makedirs(prefs_dir)
+        expected_result = []
+        for name in ('AndroidStudio3.0', 'AndroidStudio3.1'):
+            studio_config_dir = os.path.join(prefs_dir, name)
+            os.mkdir(studio_config_dir)
+            expected_result.append(studio_config_dir)
 
         obj = ide_util.IdeMacStudio()
         config_paths = obj._get_config_root_paths()
@@ -664,6 +651,24 @@ class IdeUtilUnittests(unittest.TestCase):
         self.assertTrue(mock_get_pos.called)
         self.assertTrue(mock_init_inst.called)
 
+    @mock.patch.object(ide_common_util, 'get_intellij_version_path')
+    def test_linux_intellij_get_ce_ue_versions(self, mock_version_path):
+        """Test _get_ce_ue_versions of IdeLinuxIntelliJ globs /opt once."""
+        ide_obj = ide_util.IdeLinuxIntelliJ('default_path')
+        mock_version_path.reset_mock()
+        mock_version_path.return_value = [
+            '/opt/intellij-ue-2019.1/bin/idea.sh',
+            '/opt/intellij-ce-2019.2/bin/idea.sh',
+            '/opt/intellij-ce-2018.3/bin/idea.sh']
+        ce_paths, ue_paths = ide_obj._get_ce_ue_versions()
+        self.assertEqual(ce_paths, ['/opt/intellij-ce-2019.2/bin/idea.sh',
+                                    '/opt/intellij-ce-2018.3/bin/idea.sh'])
+        self.assertEqual(ue_paths, ['/opt/intellij-ue-2019.1/bin/idea.sh'])
+        mock_version_path.assert_called_once_with(
+            '/opt/intellij-*/bin/idea.sh')
+        mock_version_path.return_value = None
+        self.assertEqual(ide_obj._get_ce_ue_versions(), (None, None))
+
     def test_get_all_versions(self):
         """Test _get_all_versions."""
         ide = ide_util.IdeIntelliJ()
@@ -28,6 +28,17 @@ from aidegen.lib import project_config
 from aidegen.lib import source_locator
 from atest import module_info as amodule_info
 
+_JAVA_FILE = os.path.join(unittest_constants.TEST_DATA_PATH,
+                          unittest_constants.MODULE_PATH,
+                          'src/main/java/com/android/java.java')
+_NO_PACKAGE_JAVA_FILE = os.path.join(unittest_constants.TEST_DATA_PATH,
+                                     unittest_constants.MODULE_PATH,
+                                     'src/main/java/com/android/'
+                                     'no_package.java')
+_TEST_JAR = os.path.join(unittest_constants.MODULE_PATH, 'test.jar')
+_TESTS_DIR = os.path.join(unittest_constants.MODULE_PATH, 'tests/')
+_TEST_SECOND_JAR = os.path.join(_TESTS_DIR, 'test_second.jar')
+
 
 # pylint: disable=too-many-arguments
 # pylint: disable=protected-access
@@ -35,15 +46,21 @@ from atest import module_info as amodule_info
 class ModuleDataUnittests(unittest.TestCase):
     """Unit tests for module_data.py"""
 
+    def setUp(self):
+        """Patch the Android root directory to the test data path."""
+        patcher = mock.patch.object(common_util, 'get_android_root_dir')
+        self.mock_android_root_dir = patcher.start()
+        self.mock_android_root_dir.return_value = (
+            unittest_constants.TEST_DATA_PATH)
+        self.addCleanup(patcher.stop)
+
     @mock.patch('os.path.dirname')
     @mock.patch('logging.debug')
     @mock.patch.object(source_locator.ModuleData, '_get_source_folder')
     @mock.patch.object(source_locator.ModuleData, '_check_key')
     @mock.patch.object(common_util, 'is_target')
-    @mock.patch.object(common_util, 'get_android_root_dir')
-    def test_collect_srcs_paths(self, mock_android_root_dir, mock_is_target,
-                                mock_check_key, mock_get_src, mock_log,
-                                mock_dirname):
+    def test_collect_srcs_paths(self, mock_is_target, mock_check_key,
+                                mock_get_src, mock_log, mock_dirname):
         """Test _collect_srcs_paths create the source path list."""
         module = source_locator.ModuleData(
             unittest_constants.TEST_MODULE, unittest_constants.MODULE_INFO, 0)
@@ -52,7 +69,6 @@ class ModuleDataUnittests(unittest.TestCase):
         self.assertFalse(mock_dirname.called)
         mock_check_key.return_value = True
         mock_is_target.return_value = True
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module._collect_srcs_paths()
         self.assertTrue(mock_is_target.called)
         self.assertTrue(mock_get_src.called)
@@ -63,27 +79,20 @@ class ModuleDataUnittests(unittest.TestCase):
     def test_get_package_name(self):
         """test get the package name from a java file."""
         result_package_name = 'com.android'
-        test_java = os.path.join(unittest_constants.TEST_DATA_PATH,
-                                 unittest_constants.MODULE_PATH,
-                                 'src/main/java/com/android/java.java')
-        package_name = source_locator.ModuleData._get_package_name(test_java)
+        package_name = source_locator.ModuleData._get_package_name(_JAVA_FILE)
         self.assertEqual(package_name, result_package_name)
 
         # Test on java file with no package name.
         result_package_name = None
-        test_java = os.path.join(unittest_constants.TEST_DATA_PATH,
-                                 unittest_constants.MODULE_PATH,
-                                 'src/main/java/com/android/no_package.java')
-        package_name = source_locator.ModuleData._get_package_name(test_java)
+        package_name = source_locator.ModuleData._get_package_name(
+            _NO_PACKAGE_JAVA_FILE)
         self.assertEqual(package_name, result_package_name)
 
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_get_source_folder(self, mock_android_root_dir):
+    def test_get_source_folder(self):
         """Test _get_source_folder process."""
         # Test for getting the source path by parse package name from a java.
         test_java = 'packages/apps/test/src/main/java/com/android/java.java'
         result_source = 'packages/apps/test/src/main/java'
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(
             unittest_constants.TEST_MODULE, unittest_constants.MODULE_INFO, 0)
         src_path = module_data._get_source_folder(test_java)
@@ -104,39 +113,28 @@ class ModuleDataUnittests(unittest.TestCase):
         """Test get_r_dir."""
         module_data = source_locator.ModuleData(
             unittest_constants.TEST_MODULE, unittest_constants.MODULE_INFO, 0)
-        # Test for aapt2.srcjar
-        test_aapt2_srcjar = 'a/aapt2.srcjar'
-        expect_result = 'a/aapt2'
-        r_dir = module_data._get_r_dir(test_aapt2_srcjar)
-        self.assertEqual(r_dir, expect_result)
-
-        # Test for R.srcjar
-        test_r_jar = 'b/android/R.srcjar'
-        expect_result = 'b/aapt2/R'
-        r_dir = module_data._get_r_dir(test_r_jar)
-        self.assertEqual(r_dir, expect_result)
-
-        # Test the R.srcjar is not under the android folder.
-        test_wrong_r_jar = 'b/test/R.srcjar'
-        expect_result = None
-        r_dir = module_data._get_r_dir(test_wrong_r_jar)
-        self.assertEqual(r_dir, expect_result)
-
-        # Test for the target file is not aapt2.srcjar or R.srcjar
-        test_unknown_target = 'c/proto.srcjar'
-        expect_result = None
-        r_dir = module_data._get_r_dir(test_unknown_target)
-        self.assertEqual(r_dir, expect_result)
+        test_cases = [
+            # Test for aapt2.srcjar
+            ('a/aapt2.srcjar', 'a/aapt2'),
+            # Test for R.srcjar
+            ('b/android/R.srcjar', 'b/aapt2/R'),
+            # Test the R.srcjar is not under the android folder.
+            ('b/test/R.srcjar', None),
+            # Test for the target file is not aapt2.srcjar or R.srcjar
+            ('c/proto.srcjar', None),
+        ]
+        for test_srcjar, expect_result in test_cases:
+            with self.subTest(test_srcjar=test_srcjar):
+                self.assertEqual(module_data._get_r_dir(test_srcjar),
+                                 expect_result)
 
     @mock.patch('os.path.exists')
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_collect_r_src_path(self, mock_android_root_dir, mock_exists):
+    def test_collect_r_src_path(self, mock_exists):
         """Test collect_r_src_path."""
         mock_exists.return_value = True
         # Test on target srcjar exists in srcjars.
         test_module = dict(unittest_constants.MODULE_INFO)
         test_module['srcs'] = []
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 test_module, 0)
         # Test the module is not APPS.
@@ -173,60 +171,32 @@ class ModuleDataUnittests(unittest.TestCase):
         self.assertEqual(module_data.r_java_paths, expect_result)
         mock_exists.return_value = False
         module_data._collect_r_srcs_paths()
-        expect_result = set([('out/soong/.intermediates/packages/apps/'
-                              'test_aapt2/aapt2.srcjar')])
+        expect_result = {('out/soong/.intermediates/packages/apps/'
+                          'test_aapt2/aapt2.srcjar')}
         self.assertEqual(module_data.build_targets, expect_result)
 
 
     def test_parse_source_path(self):
         """Test _parse_source_path."""
-        # The package name of e.java is c.d.
-        test_java = 'a/b/c/d/e.java'
-        package_name = 'c.d'
-        expect_result = 'a/b'
-        src_path = source_locator.ModuleData._parse_source_path(
-            test_java, package_name)
-        self.assertEqual(src_path, expect_result)
-
-        # The package name of e.java is c.d.
-        test_java = 'a/b/c.d/e.java'
-        package_name = 'c.d'
-        expect_result = 'a/b'
-        src_path = source_locator.ModuleData._parse_source_path(
-            test_java, package_name)
-        self.assertEqual(src_path, expect_result)
-
-        # The package name of e.java is x.y.
-        test_java = 'a/b/c/d/e.java'
-        package_name = 'x.y'
-        expect_result = 'a/b/c/d'
-        src_path = source_locator.ModuleData._parse_source_path(
-            test_java, package_name)
-        self.assertEqual(src_path, expect_result)
-
-        # The package name of f.java is c.d.
-        test_java = 'a/b/c.d/e/c/d/f.java'
-        package_name = 'c.d'
-        expect_result = 'a/b/c.d/e'
-        src_path = source_locator.ModuleData._parse_source_path(
-            test_java, package_name)
-        self.assertEqual(src_path, expect_result)
-
-        # The package name of f.java is c.d.e.
-        test_java = 'a/b/c.d/e/c.d/e/f.java'
-        package_name = 'c.d.e'
-        expect_result = 'a/b/c.d/e'
-        src_path = source_locator.ModuleData._parse_source_path(
-            test_java, package_name)
-        self.assertEqual(src_path, expect_result)
-
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_append_jar_file(self, mock_android_root_dir):
+        # Each case is (java file, package name, expected source path).
+        test_cases = [
+            ('a/b/c/d/e.java', 'c.d', 'a/b'),
+            ('a/b/c.d/e.java', 'c.d', 'a/b'),
+            ('a/b/c/d/e.java', 'x.y', 'a/b/c/d'),
+            ('a/b/c.d/e/c/d/f.java', 'c.d', 'a/b/c.d/e'),
+            ('a/b/c.d/e/c.d/e/f.java', 'c.d.e', 'a/b/c.d/e'),
+        ]
+        for test_java, package_name, expect_result in test_cases:
+            with self.subTest(test_java=test_java, package_name=package_name):
+                src_path = source_locator.ModuleData._parse_source_path(
+                    test_java, package_name)
+                self.assertEqual(src_path, expect_result)
+
+    def test_append_jar_file(self):
         """Test _append_jar_file process."""
         # Append an existing jar file path to module_data.jar_files.
-        test_jar_file = os.path.join(unittest_constants.MODULE_PATH, 'test.jar')
+        test_jar_file = _TEST_JAR
         result_jar_list = [test_jar_file]
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(
             unittest_constants.TEST_MODULE, unittest_constants.MODULE_INFO, 0)
         module_data._append_jar_file(test_jar_file)
@@ -248,23 +218,17 @@ class ModuleDataUnittests(unittest.TestCase):
         self.assertEqual(module_data.jar_files, [])
 
     @mock.patch.object(source_locator.ModuleData, '_check_key')
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_append_jar_from_installed(self, mock_android_root_dir,
-                                       mock_check_key):
+    def test_append_jar_from_installed(self, mock_check_key):
         """Test _append_jar_from_installed handling."""
         mock_check_key.return_value = True
         # Test appends the first jar file of 'installed'.
         mod_info = dict(unittest_constants.MODULE_INFO)
         mod_info['installed'] = [
             os.path.join(unittest_constants.MODULE_PATH, 'test.aar'),
-            os.path.join(unittest_constants.MODULE_PATH, 'test.jar'),
-            os.path.join(unittest_constants.MODULE_PATH,
-                         'tests/test_second.jar')
+            _TEST_JAR,
+            _TEST_SECOND_JAR
         ]
-        result_jar_list = [
-            os.path.join(unittest_constants.MODULE_PATH, 'test.jar')
-        ]
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
+        result_jar_list = [_TEST_JAR]
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 mod_info, 0)
         module_data._append_jar_from_installed()
@@ -272,22 +236,16 @@ class ModuleDataUnittests(unittest.TestCase):
 
         # Test on the jar file path matches the path prefix.
         module_data.jar_files = []
-        result_jar_list = [
-            os.path.join(unittest_constants.MODULE_PATH,
-                         'tests/test_second.jar')
-        ]
-        module_data._append_jar_from_installed(
-            os.path.join(unittest_constants.MODULE_PATH, 'tests/'))
+        result_jar_list = [_TEST_SECOND_JAR]
+        module_data._append_jar_from_installed(_TESTS_DIR)
         self.assertEqual(module_data.jar_files, result_jar_list)
         mock_check_key.return_value = False
         module_data.jar_files = []
-        module_data._append_jar_from_installed(
-            os.path.join(unittest_constants.MODULE_PATH, 'tests/'))
+        module_data._append_jar_from_installed(_TESTS_DIR)
         self.assertEqual(module_data.jar_files, [])
 
 
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_set_jars_jarfile(self, mock_android_root_dir):
+    def test_set_jars_jarfile(self):
         """Test _set_jars_jarfile handling."""
         # Combine the module path with jar file name in 'jars' and then append
         # it to module_data.jar_files.
@@ -297,21 +255,15 @@ class ModuleDataUnittests(unittest.TestCase):
             'src/test.jar',  # This jar file doesn't exist.
             'tests/test_second.jar'
         ]
-        result_jar_list = [
-            os.path.join(unittest_constants.MODULE_PATH, 'test.jar'),
-            os.path.join(unittest_constants.MODULE_PATH,
-                         'tests/test_second.jar')
-        ]
+        result_jar_list = [_TEST_JAR, _TEST_SECOND_JAR]
         result_missing_jars = set()
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 mod_info, 0)
         module_data._set_jars_jarfile()
         self.assertEqual(module_data.jar_files, result_jar_list)
         self.assertEqual(module_data.missing_jars, result_missing_jars)
 
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_locate_sources_path(self, mock_android_root_dir):
+    def test_locate_sources_path(self):
         """Test locate_sources_path handling."""
         # Test collect source path.
         mod_info = dict(unittest_constants.MODULE_INFO)
@@ -319,7 +271,6 @@ class ModuleDataUnittests(unittest.TestCase):
         result_test_list = ['packages/apps/test/tests']
         result_jar_list = []
         result_r_path = []
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 mod_info, 0)
         module_data.locate_sources_path()
@@ -339,8 +290,7 @@ class ModuleDataUnittests(unittest.TestCase):
         module_data.locate_sources_path()
         self.assertEqual(module_data.jar_files, result_jar_list)
 
-    @mock.patch('aidegen.lib.common_util.get_android_root_dir')
-    def test_collect_jar_by_depth_value(self, mock_android_root_dir):
+    def test_collect_jar_by_depth_value(self):
         """Test parameter --depth handling."""
         # Test find jar by module's depth greater than the --depth value from
         # command line.
@@ -356,7 +306,6 @@ class ModuleDataUnittests(unittest.TestCase):
             ('out/soong/.intermediates/packages/apps/test/test/'
              'android_common/test.jar')
         ]
-        mock_android_root_dir.return_value = unittest_constants.TEST_DATA_PATH
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 mod_info, depth_by_source)
         module_data.locate_sources_path()
@@ -434,7 +383,7 @@ class ModuleDataUnittests(unittest.TestCase):
 
         mock_exists.return_value = False
         test_module['srcjars'] = ['a/b/aidl0.srcjar']
-        expacted_result = set(['a/b/aidl0.srcjar'])
+        expacted_result = {'a/b/aidl0.srcjar'}
         module_data = source_locator.ModuleData(unittest_constants.TEST_MODULE,
                                                 test_module, 0)
         module_data._collect_all_srcjar_paths()
@@ -448,7 +397,7 @@ class ModuleDataUnittests(unittest.TestCase):
         test_path = 'a/b/c'
         mod_data = source_locator.EclipseModuleData(mod_name, mod_info,
                                                     test_path)
-        mod_data.missing_jars = set('a')
+        mod_data.missing_jars = {'a'}
         mod_data.referenced_by_jar = False
         mod_data._collect_missing_jars()
         self.assertEqual(mod_data.build_targets, set())
@@ -465,10 +414,9 @@ class ModuleDataUnittests(unittest.TestCase):
         self.assertTrue(mock_check_key.called)
 
     @mock.patch('os.path.exists')
-    @mock.patch.object(common_util, 'get_android_root_dir')
-    def test_switch_repackaged(self, mock_android_root_dir, mock_exist):
+    def test_switch_repackaged(self, mock_exist):
         """Test _switch_repackaged."""
-        mock_android_root_dir.return_value = '/a'
+        self.mock_android_root_dir.return_value = '/a'
         mock_exist.return_value = False
         mod_data = source_locator.ModuleData(
             unittest_constants.TEST_MODULE, unittest_constants.MODULE_INFO, 0)
@@ -605,61 +553,37 @@ class EclipseModuleDataUnittests(unittest.TestCase):
         self.assertTrue(mock_src.called)
         self.assertTrue(mock_r.called)
 
-    @mock.patch.object(source_locator.ModuleData, '_append_classes_jar')
-    @mock.patch.object(source_locator.ModuleData, '_check_key')
-    @mock.patch.object(source_locator.ModuleData, '_set_jars_jarfile')
-    @mock.patch.object(source_locator.ModuleData, '_check_jars_exist')
-    @mock.patch.object(source_locator.ModuleData, '_append_jar_from_installed')
-    @mock.patch.object(source_locator.ModuleData, '_check_jarjar_rules_exist')
-    def test_locate_jar_path(self, mock_jarjar, mock_append_jar, mock_check_jar,
-                             mock_set_jar, mock_check_key, mock_append_class):
+    def test_locate_jar_path(self):
         """Test _locate_jar_path."""
         mod_name = 'test'
         mod_info = {'name': 'test', 'path': 'x/y'}
         test_path = 'a/b/c'
         mod_data = source_locator.EclipseModuleData(mod_name, mod_info,
                                                     test_path)
-        mock_jarjar.return_value = False
-        mock_check_jar.return_value = False
-        mock_check_key.return_value = False
-        mod_data._locate_jar_path()
-        self.assertTrue(mock_append_jar.called)
-        self.assertFalse(mock_set_jar.called)
-        self.assertFalse(mock_append_class.called)
-
-        mock_append_jar.reset_mock()
-        mock_jarjar.return_value = False
-        mock_check_jar.return_value = False
-        mock_check_key.return_value = True
-        mod_data._locate_jar_path()
-        self.assertFalse(mock_append_jar.called)
-        self.assertFalse(mock_set_jar.called)
-        self.assertTrue(mock_append_class.called)
-
-        mock_check_key.reset_mock()
-        mock_append_class.reset_mock()
-        mock_append_jar.reset_mock()
-        mock_jarjar.return_value = False
-        mock_check_jar.return_value = True
-        mod_data._locate_jar_path()
-        self.assertFalse(mock_append_jar.called)
-        self.assertTrue(mock_set_jar.called)
-        self.assertFalse(mock_check_key.called)
-        self.assertFalse(mock_append_class.called)
-
-        mock_append_jar.reset_mock()
-        mock_set_jar.reset_mock()
-        mock_check_jar.reset_mock()
-        mock_check_key.reset_mock()
-        mock_append_class.reset_mock()
-
-        mock_jarjar.return_value = True
-        mod_data._locate_jar_path()
-        self.assertTrue(mock_append_jar.called)
-        self.assertFalse(mock_check_jar.called)
-        self.assertFalse(mock_set_jar.called)
-        self.assertFalse(mock_check_key.called)
-        self.assertFalse(mock_append_class.called)
+        methods = ['_check_jarjar_rules_exist', '_check_jars_exist',
+                   '_check_key', '_append_jar_from_installed',
+                   '_set_jars_jarfile', '_append_classes_jar']
+        # Each case is the return values of _check_jarjar_rules_exist,
+        # _check_jars_exist and _check_key, and the methods expected to be
+        # called besides _check_jarjar_rules_exist.
+        test_cases = [
+            ((False, False, False),
+             {'_check_jars_exist', '_check_key', '_append_jar_from_installed'}),
+            ((False, False, True),
+             {'_check_jars_exist', '_check_key', '_append_classes_jar'}),
+            ((False, True, False), {'_check_jars_exist', '_set_jars_jarfile'}),
+            ((True, False, False), {'_append_jar_from_installed'}),
+        ]
+        for returns, expected_calls in test_cases:
+            with self.subTest(returns=returns), mock.patch.multiple(
+                    source_locator.ModuleData,
+                    **dict.fromkeys(methods, mock.DEFAULT)) as mocks:
+                for method, return_value in zip(methods, returns):
+                    mocks[method].return_value = return_value
+                mod_data._locate_jar_path()
+                for method in methods[1:]:
+                    self.assertEqual(mocks[method].called,
+                                     method in expected_calls, method)
 
     def test_add_to_source_or_test_dirs(self):
         """Test _add_to_source_or_test_dirs."""
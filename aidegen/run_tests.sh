@@ -44,22 +44,67 @@ function print_summary() {
     fi
 }
 
+function get_log_file() {
+    local test_file=$1
+    local log_dir=$2
+    echo "$log_dir/$(echo ${test_file#$AIDEGEN_DIR/} | tr / _).log"
+}
+
+function run_unittest() {
+    local test_file=$1
+    local log_dir=$2
+    PYTHONPATH=$(get_python_path) python3 -m coverage run --parallel-mode \
+        --rcfile=$RC_FILE $test_file >$(get_log_file $test_file $log_dir) 2>&1
+}
+
+function print_failure() {
+    local test_file=$1
+    local log_dir=$2
+    echo -e "${RED}$test_file failed${NC}"
+    cat $(get_log_file $test_file $log_dir)
+}
+
 function run_unittests() {
     local specified_tests=$@
     local rc=0
+    local log_dir=$(mktemp -d)
+    local pids=()
+    local tests=()
+    local serial_tests=()
 
     # Get all unit tests under tools/acloud.
     local all_tests=$(find $AIDEGEN_DIR -type f -name "*_unittest.py");
     local tests_to_run=$all_tests
 
     python3 -m coverage erase
+    # Run the test files in parallel processes, each one writes its own
+    # coverage data file to be combined later and its output to a log file.
+    # The test files using the test_data folder run one after another, some of
+    # them generate files in it while others copy it.
     for t in $tests_to_run; do
-        echo "Testing" $t
-        if ! PYTHONPATH=$(get_python_path) python3 -m coverage run --append --rcfile=$RC_FILE $t; then
+        if grep -q "TEST_DATA_PATH\|ANDROID_PROJECT_PATH\|test_data" $t; then
+            serial_tests+=($t)
+            continue
+        fi
+        run_unittest $t $log_dir &
+        pids+=($!)
+        tests+=($t)
+    done
+    echo "Testing $(echo $tests_to_run | wc -w) unittest files..."
+    for t in "${serial_tests[@]}"; do
+        if ! run_unittest $t $log_dir; then
+            rc=1
+            print_failure $t $log_dir
+        fi
+    done
+    for i in "${!pids[@]}"; do
+        if ! wait ${pids[$i]}; then
             rc=1
-            echo -e "${RED}$t failed${NC}"
+            print_failure ${tests[$i]} $log_dir
         fi
     done
+    rm -rf $log_dir
+    python3 -m coverage combine --rcfile=$RC_FILE >/dev/null
 
     print_summary $rc
     cleanup
@@ -90,9 +135,11 @@ function check_env() {
 
 function cleanup() {
     # Search for *.pyc and delete them.
-    find $AIDEGEN_DIR -name "*.pyc" -exec rm -f {} \;
+    find $AIDEGEN_DIR -name "*.pyc" -delete
 }
 
 check_env
 cleanup
+# The *.pyc files are removed after the run anyway, don't write them.
+export PYTHONDONTWRITEBYTECODE=1
 run_unittests "$@"
@@ -60,6 +60,9 @@ class AndroidSDK:
     _GLOB_PROPERTIES_FILE = os.path.join('platforms', 'android-*',
                                          'source.properties')
     _INPUT_QUERY_TIMES = 3
+    # A dictionary of the Android SDK paths mapping to their platforms mapping,
+    # so the platforms folder of a path is only scanned once.
+    _PLATFORM_MAPPING_CACHE = dict()
     _ENTER_ANDROID_SDK_PATH = ('\nThe Android SDK folder:{} doesn\'t exist. '
                                'The debug function "Attach debugger to Android '
                                'process" is disabled without Android SDK in '
@@ -161,16 +164,25 @@ class AndroidSDK:
         Returns:
             True when successful generates platform mapping, otherwise False.
         """
+        if path in self._PLATFORM_MAPPING_CACHE:
+            self._platform_mapping.update(self._PLATFORM_MAPPING_CACHE[path])
+            return bool(self._platform_mapping)
+        platform_mapping = {}
         prop_files = glob.glob(os.path.join(path, self._GLOB_PROPERTIES_FILE))
         for prop_file in prop_files:
             api_level, code_name = self._parse_api_info(prop_file)
             if not api_level:
                 continue
             platform = os.path.basename(os.path.dirname(prop_file))
-            self._platform_mapping[platform] = {
+            platform_mapping[platform] = {
                 self._API_LEVEL: int(api_level),
                 self._CODE_NAME: code_name
             }
+        # Only cache the found platforms, users might install the Android SDK
+        # and enter the same path again.
+        if platform_mapping:
+            self._PLATFORM_MAPPING_CACHE[path] = platform_mapping
+        self._platform_mapping.update(platform_mapping)
         return bool(self._platform_mapping)
 
     def is_android_sdk_path(self, path):
@@ -34,6 +34,7 @@ class AndroidSDKUnittests(unittest.TestCase):
     def tearDown(self):
         """Clear the testdata related path."""
         self.sdk = None
+        android_sdk.AndroidSDK._PLATFORM_MAPPING_CACHE.clear()
 
     def test_init(self):
         """Test initialize the attributes."""
@@ -137,6 +138,13 @@ class AndroidSDKUnittests(unittest.TestCase):
         self.assertEqual(test_result, True)
         self.assertEqual(self.sdk._platform_mapping, expected_result)
 
+        # The platforms of a found Android SDK path are only scanned once.
+        mock_glob.reset_mock()
+        test_sdk = android_sdk.AndroidSDK()
+        self.assertEqual(test_sdk._gen_platform_mapping(''), True)
+        self.assertEqual(test_sdk._platform_mapping, expected_result)
+        self.assertFalse(mock_glob.called)
+
     @mock.patch.object(android_sdk.AndroidSDK, '_gen_platform_mapping')
     def test_is_android_sdk_path(self, mock_gen_platform_mapping):
         """Test is_android_sdk_path."""
@@ -39,7 +39,6 @@ from xml.etree import ElementTree
 from aidegen import constant
 from aidegen import templates
 from aidegen.lib import aidegen_metrics
-from aidegen.lib import common_util
 from aidegen.lib import xml_util
 from aidegen.sdk import android_sdk
 
@@ -60,6 +59,9 @@ class JDKTableXML():
         _xml: An xml.etree.ElementTree object contains the XML parsing result.
         _sdk: An AndroidSDK object to get the Android SDK path and platform
               mapping.
+        _jdk_index: A dictionary of the <jdk> tags in _xml grouped by their
+                    type value, e.g. {'JavaSDK': [jdk1], 'Android SDK': [jdk2]}
+        _jdk_index_xml: The XML object which _jdk_index was built from.
     """
     _JDK = 'jdk'
     _NAME = 'name'
@@ -73,14 +75,11 @@ class JDKTableXML():
     _JDK_VERSION = 'JDK18'
     _APPLICATION = 'application'
     _COMPONENT = 'component'
+    _JDK_PATH = '/'.join([_COMPONENT, _JDK])
     _PROJECTJDKTABLE = 'ProjectJdkTable'
     _LAST_TAG_TAIL = '\n    '
     _NEW_TAG_TAIL = '\n  '
     _ANDROID_SDK_VERSION = 'Android API {CODE_NAME} Platform'
-    _DEFAULT_JDK_TABLE_XML = os.path.join(common_util.get_android_root_dir(),
-                                          constant.AIDEGEN_ROOT_PATH,
-                                          'data',
-                                          'jdk.table.xml')
     _ILLEGAL_XML = ('The {XML} is not an useful XML file for IntelliJ. Do you '
                     'agree AIDEGen override it?(y/n)')
     _IGNORE_XML_WARNING = ('The {XML} is not an useful XML file for IntelliJ. '
@@ -105,15 +104,28 @@ class JDKTableXML():
         self._default_android_sdk_path = default_android_sdk_path
         self._xml = None
         if os.path.exists(config_file):
-            xml_file = config_file
+            self._xml = xml_util.parse_xml(config_file)
         else:
-            xml_file = self._DEFAULT_JDK_TABLE_XML
-            common_util.file_generate(xml_file, templates.JDK_TABLE_XML)
-        self._xml = xml_util.parse_xml(xml_file)
+            self._xml = self._get_default_xml()
         self._platform_version = None
         self._android_sdk_version = None
         self._modify_config = False
         self._sdk = android_sdk.AndroidSDK()
+        self._jdk_index = {}
+        self._jdk_index_xml = None
+
+    @staticmethod
+    def _get_default_xml():
+        """Gets the default jdk.table.xml content.
+
+        The content is the known empty template, so the tree is built from it
+        directly instead of reading a file.
+
+        Returns:
+            An xml.etree.ElementTree object of the empty jdk.table.xml.
+        """
+        return ElementTree.ElementTree(
+            ElementTree.fromstring(templates.JDK_TABLE_XML))
 
     @property
     def android_sdk_version(self):
@@ -135,12 +147,11 @@ class JDKTableXML():
         Returns:
             Boolean: True if the structure is correct, otherwise False.
         """
-        if (not self._xml or self._xml.getroot().tag != self._APPLICATION
-                or self._xml.find(self._COMPONENT) is None
-                or self._xml.find(self._COMPONENT).tag != self._COMPONENT):
+        if not self._xml or self._xml.getroot().tag != self._APPLICATION:
             return False
-        return self._xml.find(self._COMPONENT).get(
-            self._NAME) == self._PROJECTJDKTABLE
+        component = self._xml.find(self._COMPONENT)
+        return (component is not None
+                and component.get(self._NAME) == self._PROJECTJDKTABLE)
 
     def _override_xml(self):
         """Overrides the XML file when it's invalid.
@@ -158,22 +169,43 @@ class JDKTableXML():
                 aidegen_metrics.send_exception_metrics(
                     constant.XML_PARSING_FAILURE, '',
                     ElementTree.tostring(self._xml.getroot()), '')
-            self._xml = xml_util.parse_xml(self._DEFAULT_JDK_TABLE_XML)
+            self._xml = self._get_default_xml()
             return True
         return False
 
+    def _get_jdks(self, jdk_type):
+        """Gets the <jdk> tags of a type in jdk.table.xml.
+
+        The <jdk> tags directly under <component> are grouped by type in one
+        pass, and the result is reused until the XML object is replaced or
+        changed.
+
+        Args:
+            jdk_type: A string of the type value, e.g. JavaSDK.
+
+        Returns:
+            A list of the <jdk> tags of the type.
+        """
+        if self._jdk_index_xml is not self._xml:
+            self._jdk_index = {}
+            for jdk in self._xml.iterfind(self._JDK_PATH):
+                _type = jdk.find(self._TYPE)
+                if _type is None:
+                    continue
+                self._jdk_index.setdefault(
+                    _type.get(self._VALUE), []).append(jdk)
+            self._jdk_index_xml = self._xml
+        return self._jdk_index.get(jdk_type, [])
+
     def _check_jdk18_in_xml(self):
         """Checks if the JDK18 is already set in jdk.table.xml.
 
         Returns:
             Boolean: True if the JDK18 exists else False.
         """
-        for jdk in self._xml.iter(self._JDK):
+        for jdk in self._get_jdks(self._JAVA_SDK):
             _name = jdk.find(self._NAME)
-            _type = jdk.find(self._TYPE)
-            if None in (_name, _type):
-                continue
-            if (_type.get(self._VALUE) == self._JAVA_SDK
+            if (_name is not None
                     and _name.get(self._VALUE) == self._JDK_VERSION):
                 return True
         return False
@@ -192,20 +224,18 @@ class JDKTableXML():
             Boolean: True if the Android SDK configuration exists, otherwise
                      False.
         """
-        for tag in self._xml.iter(self._JDK):
+        user_home = os.path.expanduser('~')
+        for tag in self._get_jdks(self._ANDROID_SDK):
             _name = tag.find(self._NAME)
-            _type = tag.find(self._TYPE)
             _homepath = tag.find(self._HOMEPATH)
             _additional = tag.find(self._ADDITIONAL)
-            if None in (_name, _type, _homepath, _additional):
+            if None in (_name, _homepath, _additional):
                 continue
 
-            tag_type = _type.get(self._VALUE)
             home_path = _homepath.get(self._VALUE).replace(
-                constant.USER_HOME, os.path.expanduser('~'))
+                constant.USER_HOME, user_home)
             platform = _additional.get(self._SDK)
-            if (tag_type != self._ANDROID_SDK
-                    or not self._sdk.is_android_sdk_path(home_path)
+            if (not self._sdk.is_android_sdk_path(home_path)
                     or platform not in self._sdk.platform_mapping):
                 continue
             self._android_sdk_version = _name.get(self._VALUE)
@@ -226,7 +256,8 @@ class JDKTableXML():
             component[-1].tail = self._LAST_TAG_TAIL
         else:
             component.text = self._LAST_TAG_TAIL
-        self._xml.getroot().find(self._COMPONENT).append(node)
+        component.append(node)
+        self._jdk_index_xml = None
 
     def _generate_jdk_config_string(self):
         """Generates the default JDK configuration."""
@@ -53,10 +53,9 @@ class JDKTableXMLUnittests(unittest.TestCase):
         self.jdk_table_xml = None
         shutil.rmtree(JDKTableXMLUnittests._TEST_DIR)
 
-    @mock.patch.object(common_util, 'file_generate')
     @mock.patch('os.path.exists')
     @mock.patch.object(ElementTree, 'parse')
-    def test_init(self, mock_parse, mock_exists, mock_gen_file):
+    def test_init(self, mock_parse, mock_exists):
         """Test initialize the attributes."""
         self.assertEqual(self.jdk_table_xml._platform_version, None)
         self.assertEqual(self.jdk_table_xml._android_sdk_version, None)
@@ -65,10 +64,11 @@ class JDKTableXMLUnittests(unittest.TestCase):
         mock_parse.return_value = None
         jdk_table.JDKTableXML(None, None, None, None)
         self.assertTrue(mock_parse.called)
+        mock_parse.reset_mock()
         mock_exists.return_value = False
-        jdk_table.JDKTableXML(None, None, None, None)
-        self.assertTrue(mock_parse.called)
-        self.assertTrue(mock_gen_file.called)
+        test_xml = jdk_table.JDKTableXML(None, None, None, None)
+        self.assertFalse(mock_parse.called)
+        self.assertTrue(test_xml._check_structure())
 
     def test_android_sdk_version(self):
         """Test android_sdk_version."""
@@ -168,18 +168,34 @@ class JDKTableXMLUnittests(unittest.TestCase):
 
     def test_check_jdk18_in_xml(self):
         """Test _check_jdk18_in_xml."""
-        xml_str = ('<test><jdk><name value="JDK18" /><type value="JavaSDK" />'
-                   '</jdk></test>')
+        xml_str = ('<test><component><jdk><name value="JDK18" />'
+                   '<type value="JavaSDK" />'
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertTrue(self.jdk_table_xml._check_jdk18_in_xml())
-        xml_str = ('<test><jdk><name value="test" /><type value="JavaSDK" />'
-                   '</jdk></test>')
+        xml_str = ('<test><component><jdk><name value="test" />'
+                   '<type value="JavaSDK" />'
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertFalse(self.jdk_table_xml._check_jdk18_in_xml())
-        xml_str = ('<test><jdk><name value="test" /></jdk></test>')
+        xml_str = ('<test><component><jdk><name value="test" /></jdk>'
+                   '</component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertFalse(self.jdk_table_xml._check_jdk18_in_xml())
 
+    def test_get_jdks(self):
+        """Test _get_jdks groups the jdk tags by type once."""
+        xml_str = ('<test><component><jdk><name value="JDK18" />'
+                   '<type value="JavaSDK" />'
+                   '</jdk><jdk><name value="test" /></jdk></component></test>')
+        self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
+        jdks = self.jdk_table_xml._get_jdks('JavaSDK')
+        self.assertEqual(len(jdks), 1)
+        self.assertEqual(self.jdk_table_xml._get_jdks('Android SDK'), [])
+        self.assertIs(self.jdk_table_xml._get_jdks('JavaSDK'), jdks)
+        self.jdk_table_xml._xml = ElementTree.fromstring('<test><jdk /></test>')
+        self.assertEqual(self.jdk_table_xml._get_jdks('JavaSDK'), [])
+
     @mock.patch.object(android_sdk.AndroidSDK, 'is_android_sdk_path')
     def test_check_android_sdk_in_xml(self, mock_is_android_sdk):
         """Test _check_android_sdk_in_xml."""
@@ -190,28 +206,32 @@ class JDKTableXMLUnittests(unittest.TestCase):
             },
         }
         mock_is_android_sdk.return_value = True
-        xml_str = ('<test><jdk><name value="JDK18" /><type value="JavaSDK" />'
-                   '</jdk></test>')
+        xml_str = ('<test><component><jdk><name value="JDK18" />'
+                   '<type value="JavaSDK" />'
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertFalse(self.jdk_table_xml._check_android_sdk_in_xml())
-        xml_str = ('<test><jdk><name value="Android SDK 29 platform" />'
+        xml_str = ('<test><component>'
+                   '<jdk><name value="Android SDK 29 platform" />'
                    '<type value="Android SDK" />'
                    '<additional jdk="JDK18" sdk="android-29" />'
-                   '</jdk></test>')
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertFalse(self.jdk_table_xml._check_android_sdk_in_xml())
-        xml_str = ('<test><jdk><name value="Android SDK 28 platform" />'
+        xml_str = ('<test><component>'
+                   '<jdk><name value="Android SDK 28 platform" />'
                    '<type value="Android SDK" />'
                    '<homePath value="/path/to/Android/SDK" />'
                    '<additional jdk="JDK18" sdk="android-28" />'
-                   '</jdk></test>')
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertFalse(self.jdk_table_xml._check_android_sdk_in_xml())
-        xml_str = ('<test><jdk><name value="Android SDK 29 platform" />'
+        xml_str = ('<test><component>'
+                   '<jdk><name value="Android SDK 29 platform" />'
                    '<type value="Android SDK" />'
                    '<homePath value="/path/to/Android/SDK" />'
                    '<additional jdk="JDK18" sdk="android-29" />'
-                   '</jdk></test>')
+                   '</jdk></component></test>')
         self.jdk_table_xml._xml = ElementTree.fromstring(xml_str)
         self.assertTrue(self.jdk_table_xml._check_android_sdk_in_xml())
         mock_is_android_sdk.return_value = False
@@ -237,9 +257,10 @@ class JDKTableXMLUnittests(unittest.TestCase):
         self.jdk_table_xml._generate_sdk_config_string()
         self.assertTrue(self.jdk_table_xml._modify_config)
 
+    @mock.patch.object(xml_util, 'parse_xml')
     @mock.patch.object(aidegen_metrics, 'send_exception_metrics')
     @mock.patch('builtins.input')
-    def test_override_xml(self, mock_input, mock_metrics):
+    def test_override_xml(self, mock_input, mock_metrics, mock_parse):
         """Test _override_xml."""
         mock_input.side_effect = ['1', 'n']
         self.assertFalse(self.jdk_table_xml._override_xml())
@@ -256,6 +277,8 @@ class JDKTableXMLUnittests(unittest.TestCase):
         test_result = ElementTree.tostring(self.jdk_table_xml._xml.getroot())
         self.assertEqual(test_result, expected_result)
         self.assertTrue(mock_metrics.called)
+        # The default XML is built in memory without reading any file.
+        self.assertFalse(mock_parse.called)
 
     @mock.patch.object(xml_util, 'parse_xml')
     @mock.patch.object(aidegen_metrics, 'send_exception_metrics')
@@ -266,7 +289,7 @@ class JDKTableXMLUnittests(unittest.TestCase):
         self.jdk_table_xml._xml = None
         self.jdk_table_xml._override_xml()
         self.assertFalse(mock_metrics.called)
-        self.assertTrue(mock_parse.called)
+        self.assertFalse(mock_parse.called)
 
 
 if __name__ == '__main__':
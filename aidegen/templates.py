@@ -15,20 +15,6 @@
 # limitations under the License.
 """The iml/xml templates of AIDEgen."""
 
-# Content of iml file.
-FILE_IML = """<?xml version="1.0" encoding="UTF-8"?>
-<module type="JAVA_MODULE" version="4">
-@FACETS@
-    <component name="NewModuleRootManager" inherit-compiler-output="true">
-        <exclude-output />
-@SOURCES@
-@SRCJAR@
-        <orderEntry type="sourceFolder" forTests="false" />
-@MODULE_DEPENDENCIES@
-        <orderEntry type="inheritedJdk" />
-    </component>
-</module>
-"""
 # TODO(b/153704028): Refactor to create iml file.
 IML = """<?xml version="1.0" encoding="UTF-8"?>
 <module type="JAVA_MODULE" version="4">{FACET}
@@ -200,8 +186,9 @@ XML_PROFILES_SETTINGS = """<component name="CopyrightManager">
 </component>
 """
 
-# The configuration of JDK on Linux.
-LINUX_JDK_XML = """    <jdk version="2">
+# The common head of the JDK configuration, the class path roots are left open
+# for the platform specific roots.
+_JDK_XML_HEAD = """    <jdk version="2">
       <name value="JDK18" />
       <type value="JavaSDK" />
       <version value="java version &quot;1.8.0_152&quot;" />
@@ -229,58 +216,17 @@ LINUX_JDK_XML = """    <jdk version="2">
             <root url="jar://{JDKpath}/jre/lib/management-agent.jar!/" type="simple" />
             <root url="jar://{JDKpath}/jre/lib/resources.jar!/" type="simple" />
             <root url="jar://{JDKpath}/jre/lib/rt.jar!/" type="simple" />
-          </root>
-        </classPath>
-        <javadocPath>
-          <root type="composite" />
-        </javadocPath>
-        <sourcePath>
-          <root type="composite">
-            <root url="jar://{JDKpath}/src.zip!/" type="simple" />
-          </root>
-        </sourcePath>
-      </roots>
-      <additional />
-    </jdk>
 """
 
-# The configuration of JDK on Mac.
-MAC_JDK_XML = """    <jdk version="2">
-      <name value="JDK18" />
-      <type value="JavaSDK" />
-      <version value="java version &quot;1.8.0_152&quot;" />
-      <homePath value="{JDKpath}" />
-      <roots>
-        <annotationsPath>
-          <root type="composite">
-            <root url="jar://$APPLICATION_HOME_DIR$/lib/jdkAnnotations.jar!/" type="simple" />
-          </root>
-        </annotationsPath>
-        <classPath>
-          <root type="composite">
-            <root url="jar://{JDKpath}/jre/lib/charsets.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/cldrdata.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/dnsns.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/jaccess.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/localedata.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/nashorn.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/sunec.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/sunjce_provider.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/sunpkcs11.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/ext/zipfs.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/jce.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/jsse.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/management-agent.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/resources.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/rt.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/management-agent.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/resources.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/jre/lib/rt.jar!/" type="simple" />
-            <root url="jar://{JDKpath}/lib/dt.jar!/" type="simple" />
+# The extra class path roots of the JDK on Mac.
+_MAC_JDK_EXTRA_ROOTS = """            <root url="jar://{JDKpath}/lib/dt.jar!/" type="simple" />
             <root url="jar://{JDKpath}/lib/jconsole.jar!/" type="simple" />
             <root url="jar://{JDKpath}/lib/sa-jdi.jar!/" type="simple" />
             <root url="jar://{JDKpath}/lib/tools.jar!/" type="simple" />
-          </root>
+"""
+
+# The common tail of the JDK configuration.
+_JDK_XML_TAIL = """          </root>
         </classPath>
         <javadocPath>
           <root type="composite" />
@@ -295,6 +241,12 @@ MAC_JDK_XML = """    <jdk version="2">
     </jdk>
 """
 
+# The configuration of JDK on Linux.
+LINUX_JDK_XML = _JDK_XML_HEAD + _JDK_XML_TAIL
+
+# The configuration of JDK on Mac.
+MAC_JDK_XML = _JDK_XML_HEAD + _MAC_JDK_EXTRA_ROOTS + _JDK_XML_TAIL
+
 # The file's header of CLion project file.
 CMAKELISTS_HEADER = """# THIS FILE WAS AUTOMATICALLY GENERATED!
 # ANY MODIFICATION WILL BE OVERWRITTEN!
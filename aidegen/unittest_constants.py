@@ -23,6 +23,7 @@ operation.
 """
 
 import os
+import types
 
 from aidegen.lib import common_util
 
@@ -45,15 +46,17 @@ ANDROID_SOURCE_DICT = {
 JAR_DEP_LIST = ['test1.jar', 'test2.jar']
 ANDROID_PROJECT_PATH = os.path.join(TEST_DATA_PATH, 'android_project')
 MODULE_PATH = 'packages/apps/test'
-MODULE_INFO = {
-    'path': [MODULE_PATH],
-    'srcs': [
+# Read-only so tests sharing it can't leak changes into each other, copy it
+# with dict() to modify.
+MODULE_INFO = types.MappingProxyType({
+    'path': (MODULE_PATH,),
+    'srcs': (
         'packages/apps/test/src/main/java/com/android/java.java',
         'packages/apps/test/tests/com/android/test.java',
-    ],
-    'dependencies': [],
-    'installed': []
-}
+    ),
+    'dependencies': (),
+    'installed': ()
+})
 PATH_TO_MULT_MODULES_WITH_MULTI_ARCH = 'shared/path/to/be/used2'
 TESTABLE_MODULES_WITH_SHARED_PATH = [
     'multiarch', 'multiarch1', 'multiarch2', 'multiarch3', 'multiarch3_32'